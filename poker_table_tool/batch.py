@@ -0,0 +1,104 @@
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from poker_table_tool.hand_history import list_hand_history_files, parse_file
+from poker_table_tool.heroes import HeroCache
+from poker_table_tool.pipeline import Pipeline
+
+
+def load_stable(config_file):
+    """Read a stable config mapping each player to their account aliases and hand history folders.
+
+    Example::
+
+        {
+            "alice": {"accounts": ["alice88", "AliceGG"], "directories": ["hh/alice"]},
+            "bob": {"accounts": ["b0b"], "directories": ["hh/bob", "hh/bob-old"]}
+        }
+
+    Relative directories are resolved against the config file's folder.
+    """
+    with open(config_file, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    base_dir = os.path.dirname(os.path.abspath(config_file))
+    players = {}
+    for player, settings in config.items():
+        players[player] = {
+            'accounts': list(settings['accounts']),
+            'directories': [os.path.join(base_dir, directory) for directory in settings['directories']],
+        }
+    return players
+
+
+def ingest(players, workers=None):
+    """Parse every player's files in one shared process pool and return their hands by player.
+
+    Only the lightweight parser is needed by the workers; each worker process is
+    started once and reused for all files of all players. The accounts are
+    explicit, so the workers use a throwaway in-memory hero cache instead of
+    the persisted one, which single-player runs rely on.
+    """
+    jobs = [
+        (player, file, settings['accounts'])
+        for player, settings in players.items()
+        for file in list_hand_history_files(settings['directories'])
+    ]
+    hands_by_player = {player: [] for player in players}
+    if not jobs:
+        return hands_by_player
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(jobs) // (workers * 4))
+        results = executor.map(
+            parse_file,
+            [file for _, file, _ in jobs],
+            [accounts for _, _, accounts in jobs],
+            repeat(HeroCache()),
+            chunksize=chunksize,
+        )
+        for (player, _, _), hands in zip(jobs, results):
+            hands_by_player[player].extend(hands)
+    return hands_by_player
+
+
+def run_batch(players, output_dir, workers=None):
+    # Plotly and pandas are only needed here, in the parent process, not in the workers
+    from poker_table_tool import report
+
+    hands_by_player = ingest(players, workers)
+    player_stats = {}
+    for player, hands in hands_by_player.items():
+        pipeline = Pipeline.from_hands(hands)
+        if not pipeline.entries:
+            print(f"No valid hand histories found for {player}.")
+            continue
+
+        player_dir = os.path.join(output_dir, player)
+        os.makedirs(player_dir, exist_ok=True)
+        pipeline.write_timeline(os.path.join(player_dir, 'poker_tournaments.html'))
+        pipeline.write_session_stats(os.path.join(player_dir, 'session_stats.html'))
+        player_stats[player] = dict(pipeline.stats, Hands=len(hands))
+
+    if player_stats:
+        report.plot_stable_summary(player_stats, os.path.join(output_dir, 'stable_summary.html'))
+    return player_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate timelines and session stats for every player of a stable.")
+    parser.add_argument('config', help="JSON file mapping players to their accounts and hand history folders")
+    parser.add_argument('--output', default='reports', help="Folder to write the per-player reports to")
+    parser.add_argument('--workers', type=int, default=None, help="Number of parser processes")
+    args = parser.parse_args()
+
+    player_stats = run_batch(load_stable(args.config), args.output, args.workers)
+    print(f"Wrote reports for {len(player_stats)} players to {os.path.realpath(args.output)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,454 @@
+import os
+import re
+from collections import defaultdict
+import datetime
+
+import pytz
+
+from poker_table_tool.heroes import default_hero_cache
+
+DEALT_TO_PATTERN = re.compile(r"^Dealt to (.+?) \[", re.MULTILINE)
+HERO_SCAN_HANDS = 3
+
+# Zone every hand time is converted to; None uses the computer's own zone
+LOCAL_TIMEZONE = None
+# Zone a site writes its hand times in when the time carries no zone label.
+# None means the times are taken to be in LOCAL_TIMEZONE already.
+SITE_TIMEZONES = {
+    'ACR': None,
+    'GG': None,
+    '888': None,
+    'PokerStars': 'US/Eastern',
+    'Winamax': 'UTC',
+}
+# Zone labels printed after hand times
+TIMEZONE_ABBREVIATIONS = {
+    'UTC': 'UTC',
+    'GMT': 'UTC',
+    'ET': 'US/Eastern',
+    'CT': 'US/Central',
+    'MT': 'US/Mountain',
+    'PT': 'US/Pacific',
+    'WET': 'WET',
+    'CET': 'CET',
+    'EET': 'EET',
+    'MSK': 'Europe/Moscow',
+}
+
+def extract_tournament_label(file_name):
+    patterns = [
+        r'Tournament (.+?) \(',
+        r'TN-(.+?) GAMETYPE-',
+        r'- (.+)\.txt$',
+        r'HH\d+ (.+?)\.txt$',
+        r'\d+_(.+?)\(\d+\)_real_holdem_no-limit\.txt$',
+        r'\d+_(.+?)\.txt$',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, file_name)
+        if match:
+            return match.group(1).strip()
+    return None
+
+def extract_tournament_name_from_content(content):
+    # GG headers read "Tournament #123, Name Hold'em No Limit - Level1(...)"
+    match = re.search(r'Tournament #\d+, ([^,\n]+)', content)
+    if match:
+        tournament_name = re.sub(r"Hold'em No Limit.*", '', match.group(1)).strip()
+        tournament_name = re.sub(r'Level\d+\(.*\)', '', tournament_name).strip()
+        return tournament_name or None
+    return None
+
+def parse_file(file, hero_aliases=None, hero_cache=None):
+    """Parse a single hand history file and return its hands, tagged with the hero.
+
+    Resolved heroes are remembered in hero_cache, which defaults to the
+    cache persisted in the user's home folder.
+    """
+    if "Summary" in os.path.basename(file):
+        print(f"Skipping summary file {file}")
+        return []
+    try:
+        with open(file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        site = identify_site(content)
+        if not site:
+            print(f"Could not identify site for file {file}")
+            return []
+        tournament_label = extract_tournament_label(os.path.basename(file))
+        if hero_cache is None:
+            hero_cache = default_hero_cache()
+        hands, player = parse_hand_history(content, site, tournament_label, hero_aliases, hero_cache)
+    except Exception as e:
+        # One broken file must not stop the other files, the dashboard or a batch run
+        print(f"Error processing {file}: {e}")
+        return []
+    if not player:
+        print(f"No player found in file {file}")
+        return []
+    for hand in hands:
+        hand['player'] = player
+    return hands
+
+def list_hand_history_files(paths):
+    """Expand folders into the .txt files they contain; plain file paths are kept as given."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith('.txt'))
+        elif os.path.isfile(path):
+            files.append(path)
+    return files
+
+def load_hand_histories(file_list, hero_aliases=None, hero_cache=None):
+    hand_histories = []
+    for file in file_list:
+        hand_histories.extend(parse_file(file, hero_aliases, hero_cache))
+    return hand_histories
+
+def identify_site(content):
+    if "PokerStars Hand" in content:
+        return "PokerStars"
+    elif "Game Hand #" in content and "Tournament #" in content and "Holdem" in content:
+        return "ACR"
+    elif "888poker Hand History" in content:
+        return "888"
+    elif "Poker Hand #" in content and "Tournament #" in content:
+        return "GG"
+    elif "Winamax Poker - Tournament" in content:
+        return "Winamax"
+    else:
+        return None
+
+def parse_hand_history(content, site, tournament_label=None, hero_aliases=None, hero_cache=None):
+    hands = []
+    player = None
+
+    if site == "ACR":
+        # Extract player
+        player = detect_player(content, site, hero_aliases, hero_cache)
+        if not player:
+            print("Player not found in ACR hand history.")
+            return [], None
+
+        # Split into individual hands
+        hand_pattern = r"Game Hand #(\d+) - Tournament #(\d+)"
+        hand_blocks = split_hands(content, hand_pattern)
+        if not hand_blocks:
+            print("No hands found in ACR hand history.")
+            return [], None
+
+        # Extract the hero's stack in big blinds for every hand
+        stack_pattern = rf"Seat \d+: {re.escape(player)} \(([\d,\.]+)\)"
+        blinds_pattern = r"Level \d+ \(([\d,\.]+)/([\d,\.]+)\)"
+        stacks_bb = [hand_stack_bb(hand, stack_pattern, blinds_pattern) for hand in hand_blocks]
+        starting_bb = stacks_bb[0]
+
+        # Extract tournament info
+        tournament_pattern = r"Tournament #(\d+)"
+        date_pattern = r"- (\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})(?: (\w+))?"
+
+        tournaments = re.findall(tournament_pattern, content)
+        dates = re.findall(date_pattern, content)
+        hands_info = re.findall(hand_pattern, content)
+
+        tournament_name = tournaments[0] if tournaments else 'Unknown'
+        if not tournament_label:
+            tournament_label = tournament_name
+
+        for idx, (hand_id, tour_id) in enumerate(hands_info):
+            hand_date, zone = dates[idx] if idx < len(dates) else (None, None)
+            hands.append({
+                'site': site,
+                'tournament_id': tour_id,
+                'hand_id': hand_id,
+                'date': parse_hand_time(hand_date, ['%Y/%m/%d %H:%M:%S'], site, zone),
+                'player': player,
+                'starting_bb': starting_bb,
+                'stack_bb': stacks_bb[idx] if idx < len(stacks_bb) else None,
+                'tournament_name': tournament_name,
+                'tournament_label': tournament_label,
+            })
+
+    elif site == "GG":
+        # Extract player
+        player = detect_player(content, site, hero_aliases, hero_cache)
+        if not player:
+            print("Player not found in GG hand history.")
+            return [], None
+
+        # Split into individual hands
+        hand_blocks = re.findall(r'(Poker Hand #.*?)(?=Poker Hand #|$)', content, re.DOTALL)
+        if not hand_blocks:
+            print("No hands found in GG hand history.")
+            return [], None
+
+        # Extract the hero's stack in big blinds for every hand, earliest hand first
+        stack_pattern = rf"Seat \d+: {re.escape(player)} \(([\d,]+) in chips\)"
+        blinds_pattern = r"Level\d+\(([\d,]+)/([\d,]+)\)"
+        stacks_bb = [hand_stack_bb(hand, stack_pattern, blinds_pattern) for hand in reversed(hand_blocks)]
+        starting_bb = stacks_bb[0]
+
+        # Extract tournament info
+        tournament_pattern = r"Tournament #(\d+)"
+        date_pattern = r"Level\d+\([\d,]+/[\d,]+\) - (\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})"
+        hand_pattern = r"Poker Hand #(\S+): Tournament #(\d+)"
+
+        tournaments = re.findall(tournament_pattern, content)
+        dates = re.findall(date_pattern, content)
+        hands_info = re.findall(hand_pattern, content)
+
+        tournament_name = tournaments[0] if tournaments else 'Unknown'
+        if not tournament_label:
+            tournament_label = extract_tournament_name_from_content(content) or tournament_name
+
+        # Reverse dates and hands_info since hands are in reverse order
+        dates = dates[::-1]
+        hands_info = hands_info[::-1]
+
+        for idx, (hand_id, tour_id) in enumerate(hands_info):
+            hand_date = dates[idx] if idx < len(dates) else None
+            hands.append({
+                'site': site,
+                'tournament_id': tour_id,
+                'hand_id': hand_id,
+                'date': parse_hand_time(hand_date, ['%Y/%m/%d %H:%M:%S'], site),
+                'player': player,
+                'starting_bb': starting_bb,
+                'stack_bb': stacks_bb[idx] if idx < len(stacks_bb) else None,
+                'tournament_name': tournament_name,
+                'tournament_label': tournament_label,
+            })
+
+    elif site == "PokerStars":
+        # Split into individual hands
+        hand_blocks = re.findall(r'(PokerStars Hand #.*?)(?=(?:\n\n|\Z))', content, re.DOTALL)
+        if not hand_blocks:
+            print("No hands found in PokerStars hand history.")
+            return [], None
+
+        # Extract player
+        player = detect_player(content, site, hero_aliases, hero_cache, seat_pattern=r"Seat \d+: (\S+)(?: \(|$)")
+        if not player:
+            print("Player not found in PokerStars hand history.")
+            return [], None
+
+        # Extract starting stack and blinds from the first hand
+        stack_pattern = rf"Seat \d+: {re.escape(player)} \(([\d,]+) in chips"
+        blinds_pattern = r"Level \w+ \(([\d,]+)/([\d,]+)\)"
+        starting_bb = hand_stack_bb(hand_blocks[0], stack_pattern, blinds_pattern)
+
+        # Extract tournament info
+        tournament_pattern = r"Tournament #(\d+)"
+        tournament_match = re.search(tournament_pattern, content)
+        tournament_name = tournament_match.group(1) if tournament_match else 'Unknown'
+        if not tournament_label:
+            tournament_label = tournament_name
+
+        for hand in hand_blocks:
+            # Extract hand_id and tournament_id
+            hand_info_match = re.search(r"PokerStars Hand #(\d+): Tournament #(\d+)", hand)
+            if hand_info_match:
+                hand_id, tour_id = hand_info_match.groups()
+            else:
+                continue
+
+            # Extract date, preferring the bracketed ET time over the player's local one
+            date_match = (re.search(r"\[([\d/ :]+) (\w+)\]", hand)
+                          or re.search(r"- (\d{4}/\d{2}/\d{2} \d{1,2}:\d{2}:\d{2})(?: (\w+))?", hand))
+            if date_match:
+                hand_date_parsed = parse_hand_time(date_match.group(1), ['%Y/%m/%d %H:%M:%S'], site,
+                                                   date_match.group(2))
+            else:
+                hand_date_parsed = None
+
+            hands.append({
+                'site': site,
+                'tournament_id': tour_id,
+                'hand_id': hand_id,
+                'date': hand_date_parsed,
+                'player': player,
+                'starting_bb': starting_bb,
+                'stack_bb': hand_stack_bb(hand, stack_pattern, blinds_pattern),
+                'tournament_name': tournament_name,
+                'tournament_label': tournament_label,
+            })
+
+    elif site == "888":
+        # Extract player
+        player = detect_player(content, site, hero_aliases, hero_cache)
+        if not player:
+            print("Player not found in 888 hand history.")
+            return [], None
+
+        # Extract the hero's stack in big blinds for every hand
+        hand_pattern = r"Game (\d+)"
+        hand_blocks = split_hands(content, hand_pattern)
+        stack_pattern = rf"Seat \d+: {re.escape(player)} \( \$?([\d,\.]+) \)"
+        blinds_pattern = r"\$?([\d,\.]+)/\$?([\d,\.]+) Blinds"
+        stacks_bb = [hand_stack_bb(hand, stack_pattern, blinds_pattern) for hand in hand_blocks]
+        starting_bb = stacks_bb[0] if stacks_bb else None
+
+        # Extract tournament info
+        tournament_pattern = r"Tournament #(\d+)"
+        date_pattern = r"\*\*\* (.+)"
+
+        tournaments = re.findall(tournament_pattern, content)
+        dates = re.findall(date_pattern, content)
+        hands_info = re.findall(hand_pattern, content)
+
+        tournament_name = tournaments[0] if tournaments else 'Unknown'
+        if not tournament_label:
+            tournament_label = tournament_name
+
+        for idx, hand_id in enumerate(hands_info):
+            hand_date = dates[idx] if idx < len(dates) else None
+            hands.append({
+                'site': site,
+                'tournament_id': tournament_name,
+                'hand_id': hand_id,
+                'date': parse_hand_time(hand_date, ['%d %m %Y %H:%M:%S'], site),
+                'player': player,
+                'starting_bb': starting_bb,
+                'stack_bb': stacks_bb[idx] if idx < len(stacks_bb) else None,
+                'tournament_name': tournament_name,
+                'tournament_label': tournament_label,
+            })
+
+    elif site == "Winamax":
+        # Extract player
+        player = detect_player(content, site, hero_aliases, hero_cache)
+        if not player:
+            print("Player not found in Winamax hand history.")
+            return [], None
+
+        # Extract the hero's stack in big blinds for every hand
+        hand_pattern = r"HandId: #(\d+)-"
+        hand_blocks = split_hands(content, hand_pattern)
+        stack_pattern = rf"Seat \d+: {re.escape(player)} \(([\d\.]+)"
+        blinds_pattern = r"\((?:[\d\.]+/)?([\d\.]+)/([\d\.]+)\) - \d{4}/"
+        stacks_bb = [hand_stack_bb(hand, stack_pattern, blinds_pattern) for hand in hand_blocks]
+        starting_bb = stacks_bb[0] if stacks_bb else None
+
+        # Extract tournament info
+        tournament_pattern = r"Tournament \"(.+?)\""
+        date_pattern = r"- (\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}) UTC"
+
+        tournaments = re.findall(tournament_pattern, content)
+        dates = re.findall(date_pattern, content)
+        hands_info = re.findall(hand_pattern, content)
+
+        tournament_name = tournaments[0] if tournaments else 'Unknown'
+        if not tournament_label:
+            tournament_label = tournament_name
+
+        for idx, hand_id in enumerate(hands_info):
+            hand_date = dates[idx] if idx < len(dates) else None
+            hand_date_parsed = parse_hand_time(hand_date, ['%Y/%m/%d %H:%M:%S'], site, 'UTC')
+
+            hands.append({
+                'site': site,
+                'tournament_id': tournament_name,
+                'hand_id': hand_id,
+                'date': hand_date_parsed,
+                'player': player,
+                'starting_bb': starting_bb,
+                'stack_bb': stacks_bb[idx] if idx < len(stacks_bb) else None,
+                'tournament_name': tournament_name,
+                'tournament_label': tournament_label,
+            })
+
+    return hands, player
+
+def detect_player(content, site, hero_aliases=None, hero_cache=None, seat_pattern=r"Seat \d+: (\S+)"):
+    """Return the hero of a hand history.
+
+    A hero already cached for the site is accepted as soon as they are the
+    player dealt hole cards in the first hand, without any further scan or
+    cache write. Otherwise the hero is the player dealt hole cards in the
+    first few hands, and a newly seen hero is added to the cache. With
+    hero_aliases, files dealt to any other account have no hero. Files
+    without "Dealt to" lines fall back to the heroes cached for the site,
+    then to the most frequently seated player.
+    """
+    candidates = hero_cache.get(site) if hero_cache is not None else []
+    if hero_aliases:
+        candidates = [name for name in candidates if name in hero_aliases]
+    first_dealt = DEALT_TO_PATTERN.search(content)
+    if first_dealt and first_dealt.group(1) in candidates:
+        return first_dealt.group(1)
+
+    dealt = []
+    for match in DEALT_TO_PATTERN.finditer(content):
+        dealt.append(match.group(1))
+        if len(dealt) == HERO_SCAN_HANDS:
+            break
+    if dealt:
+        hero = max(dealt, key=dealt.count)
+        if hero_aliases and hero not in hero_aliases:
+            return None
+        if hero_cache is not None:
+            hero_cache.add(site, hero)
+        return hero
+
+    if hero_aliases:
+        candidates = candidates + list(hero_aliases)
+    for name in candidates:
+        if re.search(rf"Seat \d+: {re.escape(name)} \(", content):
+            return name
+    if hero_aliases:
+        return None
+
+    player_seats = re.findall(seat_pattern, content)
+    if not player_seats:
+        return None
+    player_counts = defaultdict(int)
+    for p in player_seats:
+        player_counts[p] += 1
+    return max(player_counts, key=player_counts.get)
+
+def split_hands(content, hand_pattern):
+    """Split content into hand blocks, each starting at a match of hand_pattern."""
+    starts = [match.start() for match in re.finditer(hand_pattern, content)]
+    return [content[start:end] for start, end in zip(starts, starts[1:] + [len(content)])]
+
+def hand_stack_bb(hand, stack_pattern, blinds_pattern):
+    """Return the hero's stack in big blinds for a single hand, or None if it cannot be read."""
+    stack_match = re.search(stack_pattern, hand)
+    blinds_match = re.search(blinds_pattern, hand)
+    if stack_match and blinds_match:
+        stack = float(stack_match.group(1).replace(',', ''))
+        big_blind = float(blinds_match.group(2).replace(',', ''))
+        if big_blind:
+            return stack / big_blind
+    return None
+
+def to_local_time(dt, timezone_name):
+    """Convert a naive time in timezone_name to a naive time in LOCAL_TIMEZONE."""
+    if dt is None or timezone_name is None:
+        return dt
+    aware = pytz.timezone(timezone_name).localize(dt)
+    if LOCAL_TIMEZONE:
+        aware = aware.astimezone(pytz.timezone(LOCAL_TIMEZONE))
+    else:
+        aware = aware.astimezone()
+    return aware.replace(tzinfo=None)
+
+def parse_hand_time(date_str, date_formats, site, zone=None):
+    """Parse a hand time and bring it onto the common LOCAL_TIMEZONE clock.
+
+    zone is the label printed after the time, if any; unlabelled times use the
+    site's zone from SITE_TIMEZONES.
+    """
+    timezone_name = TIMEZONE_ABBREVIATIONS.get(zone) or SITE_TIMEZONES.get(site)
+    return to_local_time(parse_date(date_str, date_formats), timezone_name)
+
+def parse_date(date_str, date_formats):
+    if date_str:
+        for fmt in date_formats:
+            try:
+                dt_naive = datetime.datetime.strptime(date_str.strip(), fmt)
+                return dt_naive
+            except Exception:
+                continue
+    return None
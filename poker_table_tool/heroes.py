@@ -0,0 +1,83 @@
+import json
+import os
+import threading
+from collections import defaultdict
+
+HERO_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.poker_table_tool', 'heroes.json')
+
+
+class HeroCache:
+    """Hero account names seen per site, most recent first.
+
+    With a path the cache is loaded from and saved to a JSON file, so heroes
+    resolved in one run are known to the next. Without a path it only lives
+    in memory.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.heroes = defaultdict(list)
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.heroes.update(json.load(f))
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable hero cache {path}: {e}")
+
+    def __getstate__(self):
+        # Locks cannot be pickled; batch workers receive their cache by pickling
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, site):
+        with self._lock:
+            return list(self.heroes.get(site, []))
+
+    def add(self, site, hero):
+        # The dashboard's watch thread and the GUI thread share one cache
+        with self._lock:
+            names = self.heroes[site]
+            if names[:1] == [hero]:
+                return
+            if hero in names:
+                names.remove(hero)
+            names.insert(0, hero)
+            self._save({key: list(value) for key, value in self.heroes.items()})
+
+    def _save(self, heroes):
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(heroes, f, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Could not save hero cache {self.path}: {e}")
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def default_hero_cache():
+    """Return the process-wide hero cache, backed by HERO_CACHE_FILE unless replaced."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = HeroCache(HERO_CACHE_FILE)
+        return _default_cache
+
+
+def set_default_hero_cache(cache):
+    """Replace the process-wide hero cache; None reloads it from HERO_CACHE_FILE on next use."""
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = cache
@@ -0,0 +1,68 @@
+import csv
+from functools import cached_property
+
+from poker_table_tool.hand_history import list_hand_history_files, load_hand_histories
+from poker_table_tool.stats import calculate_statistics, group_entries_by_tournament
+from poker_table_tool.timeline import build_tournament_entries
+
+EXPORT_COLUMNS = ['Tournament', 'Site', 'Player', 'Start', 'Finish', 'Starting_BB']
+
+
+class Pipeline:
+    """One pass over hand history files feeding every report.
+
+    The stages run in order, ingest -> hand records -> tournament entries ->
+    stats -> renderers, and each stage is computed once on first use and kept
+    in memory, so the timeline, the session statistics and any export all
+    share the same parsed hands.
+    """
+
+    def __init__(self, paths=(), hero_aliases=None, hero_cache=None):
+        self.paths = list(paths)
+        self.hero_aliases = hero_aliases
+        self.hero_cache = hero_cache
+
+    @classmethod
+    def from_hands(cls, hands):
+        """Start a pipeline from hands that were already ingested elsewhere."""
+        pipeline = cls()
+        pipeline.__dict__['hands'] = hands
+        return pipeline
+
+    @cached_property
+    def files(self):
+        return list_hand_history_files(self.paths)
+
+    @cached_property
+    def hands(self):
+        return load_hand_histories(self.files, self.hero_aliases, self.hero_cache)
+
+    @cached_property
+    def entries(self):
+        return build_tournament_entries(self.hands)
+
+    @cached_property
+    def tournament_data(self):
+        return group_entries_by_tournament(self.entries)
+
+    @cached_property
+    def stats(self):
+        return calculate_statistics(self.tournament_data)
+
+    # Plotly and pandas are imported by the renderers only, so parsing and stats stay light
+    def write_timeline(self, output_file='poker_tournaments.html'):
+        from poker_table_tool import report
+        report.plot_gantt_chart(self.entries, output_file)
+        return output_file
+
+    def write_session_stats(self, output_file='session_stats.html'):
+        from poker_table_tool import report
+        report.plot_tournament_data(self.tournament_data, self.stats, output_file)
+        return output_file
+
+    def export_csv(self, output_file='tournament_entries.csv'):
+        with open(output_file, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=EXPORT_COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(sorted(self.entries, key=lambda e: e['Start']))
+        return output_file
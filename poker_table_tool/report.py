@@ -0,0 +1,313 @@
+import html
+from datetime import timedelta
+import plotly.express as px
+import pandas as pd
+import plotly.io as pio
+import plotly.graph_objects as go
+
+from poker_table_tool.stacks import downsample_trajectory
+
+
+def plot_gantt_chart(entries, output_file='poker_tournaments.html'):
+    df = pd.DataFrame(entries)
+    base_colors = {
+        'GG': '#ff0000',
+        'ACR': '#0000ff',
+        'Winamax': '#008000',
+        'PokerStars': '#800080',
+        '888': '#ffa500'
+    }
+
+    df['Start'] = pd.to_datetime(df['Start'], errors='coerce')
+    df['Finish'] = pd.to_datetime(df['Finish'], errors='coerce')
+
+    df = df.dropna(subset=['Start', 'Finish'])
+
+    df['Starting_BB_Display'] = df.apply(
+        lambda row: f"Starting BB={row['Starting_BB']:.1f}" if pd.notnull(row['Starting_BB']) else "Starting BB=N/A", axis=1
+    )
+
+    custom_data = df[['Starting_BB_Display']]
+
+    fig = px.timeline(
+        df,
+        x_start="Start",
+        x_end="Finish",
+        y="Tournament",
+        color="Site",
+        color_discrete_map=base_colors,
+        custom_data=custom_data,
+    )
+
+    hover_template = '%{customdata[0]}<extra></extra>'
+
+    fig.update_traces(hovertemplate=hover_template)
+
+    fig.update_yaxes(autorange="reversed")
+    fig.update_layout(
+        title="Poker Tournaments",
+        xaxis_title="Time",
+        yaxis_title="Tournaments",
+        legend_title="Site",
+        margin=dict(l=20, r=20, t=50, b=20),
+    )
+
+    fig_html = pio.to_html(fig, full_html=False, include_plotlyjs='cdn')
+    stacks_html = pio.to_html(plot_stack_trajectories(entries), full_html=False, include_plotlyjs=False)
+    html_str = f'''
+    <html>
+    <head>
+        <title>Poker Tournaments</title>
+    </head>
+    <body>
+        {fig_html}
+        {stacks_html}
+    </body>
+    </html>
+    '''
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(html_str)
+
+
+def plot_stack_trajectories(entries):
+    # One tournament is shown at a time, picked from a dropdown, so a long
+    # session does not pile hundreds of lines into one chart
+    tournaments = {}
+    for entry in sorted(entries, key=lambda e: e['Start']):
+        if len(entry['Stack_BB']):
+            key = (entry['Site'], entry['Tournament_Id'], entry['Player'])
+            tournaments.setdefault(key, []).append(entry)
+
+    fig = go.Figure()
+    labels, trace_keys = [], []
+    for key, tournament_entries in tournaments.items():
+        first = tournament_entries[0]
+        labels.append(f"{first['Tournament']} {first['Start']:%H:%M}")
+        for bullet, entry in enumerate(tournament_entries, start=1):
+            times, stacks = downsample_trajectory(entry)
+            fig.add_trace(go.Scatter(
+                x=times,
+                y=stacks,
+                mode='lines',
+                name=f"Bullet {bullet}",
+                visible=not trace_keys or trace_keys[0] == key,
+                hovertemplate='%{y:.1f} BB<extra>%{fullData.name}</extra>',
+            ))
+            trace_keys.append(key)
+
+    buttons = [
+        dict(
+            label=label,
+            method='update',
+            args=[{'visible': [trace_key == key for trace_key in trace_keys]}, {'title': f"Stack Trajectory: {label}"}],
+        )
+        for key, label in zip(tournaments, labels)
+    ]
+    fig.update_layout(
+        title=f"Stack Trajectory: {labels[0]}" if labels else "Stack Trajectory",
+        xaxis_title="Time",
+        yaxis_title="Stack (BB)",
+        legend_title="Entry",
+        updatemenus=[dict(buttons=buttons, x=0, xanchor='left', y=1.15, yanchor='top')] if buttons else [],
+        margin=dict(l=20, r=20, t=80, b=20),
+    )
+    return fig
+
+
+# Function to plot the tournament data using Plotly and export HTML
+def plot_tournament_data(tournament_data, stats, output_file='session_stats.html'):
+    data = []
+    for i, entries in enumerate(tournament_data.values()):
+        for j, entry in enumerate(entries):
+            start_time, end_time = entry['first_hand_time'], entry['last_hand_time']
+            bb_stack = entry['stack_in_bb'] if entry['stack_in_bb'] is not None else "N/A"
+            entry_type = "Re-entry" if j > 0 else "First entry"
+            data.append({
+                'Tournament': entry['tournament_name'],
+                'Start Time': start_time,
+                'Formatted Start Time': start_time.strftime('%H:%M'),
+                'Stack (BB)': f"{bb_stack} BB" if bb_stack != "N/A" else "N/A",
+                'End Time': end_time,
+                'Index': i,
+                'Entry Type': entry_type
+            })
+
+    df = pd.DataFrame(data)
+
+    # Customizing the color scale for first entry and re-entry
+    color_discrete_map = {
+        'First entry': 'lightgrey',
+        'Re-entry': 'red'
+    }
+
+    # Create the graph
+    fig = px.timeline(
+        df,
+        x_start="Start Time",
+        x_end="End Time",
+        y='Index',
+        color='Entry Type',
+        color_discrete_map=color_discrete_map,
+        hover_data={'Formatted Start Time': True, 'Stack (BB)': True, 'Entry Type': False},
+        height=600
+    )
+    fig.update_traces(
+        hovertemplate="<b>Registered: %{customdata[0]}<br>Stack: %{customdata[1]}</b>"
+    )
+    fig.update_layout(
+        yaxis=dict(tickvals=df['Index'], ticktext=df['Tournament']),
+        xaxis_title="Session time",
+        yaxis_title="Tournament",
+        margin=dict(l=50, r=50, t=50, b=50),
+        paper_bgcolor="#333333",
+        plot_bgcolor="#333333",
+        font=dict(family="Arial", size=12, color="white")
+    )
+    fig.update_xaxes(type='date', showgrid=True, gridwidth=1, gridcolor='#444')
+    fig.update_yaxes(showgrid=False)
+
+    # Export the graph as an HTML file
+    graph_html = fig.to_html(full_html=False)
+
+    # Create the statistics block with better styling and reduced spacing between stats
+    stats_html = f"""
+        <p><b>Session duration:</b> <span class="highlight">{stats['Session duration']}</span></p>
+        <p><b>Unique tournaments played:</b> <span class="highlight">{stats['Unique tournaments played']}</span></p>
+        <p><b>Re-Entries:</b> <span class="highlight">{stats['Re-Entries']}</span></p>
+        <p><b>Total bullets:</b> <span class="highlight">{stats['Total bullets']}</span></p>
+        <p><b>Average duration per tournament:</b> <span class="highlight">{str(stats['Average duration per tournament']).split('.')[0]}</span></p>
+        <p><b>Maximum tables played at a time:</b> <span class="highlight">{stats['Maximum tables played at a time']}</span></p>
+        <p><b>Average tables played:</b> <span class="highlight">{stats['Average tables played']:.2f}</span></p>
+        <p><b>Peak tables played for (total time):</b> <span class="highlight">{str(stats['Peak tables played for (total time)']).split('.')[0]}</span></p>
+    """
+
+    # Combine the graph and statistics into one HTML page
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(f"""
+        <html>
+        <head>
+            <title>Seven Goats Session Analyzer</title>
+            <style>
+                body {{
+                    font-family: Arial, sans-serif;
+                    background-color: #333333;
+                    color: white;
+                }}
+                .container {{
+                    width: 90%;
+                    margin: 0 auto;
+                }}
+                .stats {{
+                    padding: 15px;
+                    background-color: #222;
+                    border: 1px solid #444;
+                    border-radius: 5px;
+                    margin-bottom: 15px;
+                }}
+                h3 {{
+                    color: #58A65A;
+                    text-align: center;
+                }}
+                p {{
+                    color: white;
+                    margin: 5px 0;  /* Reducing space between paragraphs */
+                }}
+                .highlight {{
+                    color: #58A65A;
+                    font-weight: bold;
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="stats">
+                    <h3>Session Statistics</h3>
+                    {stats_html}
+                </div>
+                {graph_html}
+            </div>
+        </body>
+        </html>
+        """)
+
+
+# Function to export one row of session statistics per player of a stable
+def plot_stable_summary(player_stats, output_file='stable_summary.html'):
+    columns = [
+        "Hands",
+        "Session duration",
+        "Unique tournaments played",
+        "Re-Entries",
+        "Total bullets",
+        "Average duration per tournament",
+        "Maximum tables played at a time",
+        "Average tables played",
+    ]
+    totals = {
+        column: sum(stats[column] for stats in player_stats.values())
+        for column in ("Hands", "Unique tournaments played", "Re-Entries", "Total bullets")
+    }
+
+    def cell(stats, column):
+        value = stats.get(column, "")
+        if isinstance(value, float):
+            value = f"{value:.2f}"
+        elif isinstance(value, timedelta):
+            value = str(value).split('.')[0]
+        return f"<td>{html.escape(str(value))}</td>"
+
+    header_html = "".join(f"<th>{html.escape(column)}</th>" for column in ["Player"] + columns)
+    rows_html = "".join(
+        f"<tr><td>{html.escape(player)}</td>{''.join(cell(stats, column) for column in columns)}</tr>"
+        for player, stats in player_stats.items()
+    )
+    totals_html = f"<tr class=\"highlight\"><td>Stable</td>{''.join(cell(totals, column) for column in columns)}</tr>"
+
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(f"""
+        <html>
+        <head>
+            <title>Stable Summary</title>
+            <style>
+                body {{
+                    font-family: Arial, sans-serif;
+                    background-color: #333333;
+                    color: white;
+                }}
+                .container {{
+                    width: 90%;
+                    margin: 0 auto;
+                }}
+                h3 {{
+                    color: #58A65A;
+                    text-align: center;
+                }}
+                table {{
+                    width: 100%;
+                    border-collapse: collapse;
+                    background-color: #222;
+                }}
+                th, td {{
+                    padding: 6px 10px;
+                    border: 1px solid #444;
+                    text-align: left;
+                }}
+                .highlight {{
+                    color: #58A65A;
+                    font-weight: bold;
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h3>Stable Summary</h3>
+                <table>
+                    <tr>{header_html}</tr>
+                    {rows_html}
+                    {totals_html}
+                </table>
+            </div>
+        </body>
+        </html>
+        """)
@@ -0,0 +1,409 @@
+import argparse
+import json
+import os
+import threading
+import time
+import webbrowser
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from poker_table_tool.hand_history import list_hand_history_files, parse_file
+from poker_table_tool.pipeline import Pipeline
+from poker_table_tool.stacks import downsample_trajectory
+
+HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_INTERVAL = 5
+TRAJECTORY_KEYS = ('Hand_Offsets', 'Stack_BB')
+
+
+def to_json_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return str(value).split('.')[0]
+    if isinstance(value, float):
+        return round(value, 2)
+    return value
+
+
+def to_json_dict(data, exclude=()):
+    return {key: to_json_value(value) for key, value in data.items() if key not in exclude}
+
+
+class DashboardState:
+    """Parsed entries kept in memory, re-parsing only files that changed on disk.
+
+    Every entry remembers when it last changed, so clients can ask for the
+    entries (and removals) newer than the timestamp of their previous fetch.
+    """
+
+    def __init__(self, paths):
+        self.paths = list(paths)
+        self.timestamp = 0.0
+        self._files = {}
+        self._entries = {}
+        self._updated = {}
+        self._removed = {}
+        self._stats = None
+        self._stats_updated = 0.0
+        self._changed = threading.Condition()
+
+    def refresh(self):
+        """Re-parse new or modified files and record which entries changed. Returns True on change."""
+        files = list_hand_history_files(self.paths)
+        parsed = {}
+        for file in files:
+            try:
+                mtime = os.path.getmtime(file)
+            except OSError:
+                continue
+            cached = self._files.get(file)
+            if cached and cached[0] == mtime:
+                parsed[file] = cached
+            else:
+                parsed[file] = (mtime, parse_file(file))
+
+        if parsed.keys() == self._files.keys() and all(parsed[f] is self._files[f] for f in parsed):
+            return False
+
+        pipeline = Pipeline.from_hands([hand for _, file_hands in parsed.values() for hand in file_hands])
+        entries = {entry['Id']: entry for entry in pipeline.entries}
+
+        with self._changed:
+            now = max(time.time(), self.timestamp + 1e-6)
+            changed = False
+            for entry_id, entry in entries.items():
+                if self._entries.get(entry_id) != entry:
+                    self._updated[entry_id] = now
+                    self._removed.pop(entry_id, None)
+                    changed = True
+            for entry_id in self._entries.keys() - entries.keys():
+                self._updated.pop(entry_id, None)
+                self._removed[entry_id] = now
+                changed = True
+            self._files = parsed
+            self._entries = entries
+            if changed:
+                stats = to_json_dict(pipeline.stats)
+                if stats != self._stats:
+                    self._stats = stats
+                    self._stats_updated = now
+                self.timestamp = now
+                self._changed.notify_all()
+            return changed
+
+    def timeline_since(self, since):
+        with self._changed:
+            return {
+                'timestamp': self.timestamp,
+                'entries': [
+                    to_json_dict(self._entries[entry_id], exclude=TRAJECTORY_KEYS)
+                    for entry_id, updated in self._updated.items() if updated > since
+                ],
+                'removed': [entry_id for entry_id, removed in self._removed.items() if removed > since],
+            }
+
+    def stacks_since(self, since):
+        with self._changed:
+            changed = [self._entries[entry_id] for entry_id, updated in self._updated.items() if updated > since]
+            removed = [entry_id for entry_id, removed in self._removed.items() if removed > since]
+            timestamp = self.timestamp
+        stacks = []
+        for entry in changed:
+            times, stack_bb = downsample_trajectory(entry)
+            stacks.append({
+                'Id': entry['Id'],
+                'Key': f"{entry['Site']}|{entry['Tournament_Id']}|{entry['Player']}",
+                'Tournament': entry['Tournament'],
+                'Times': [hand_time.isoformat() for hand_time in times],
+                'Stack_BB': stack_bb,
+            })
+        return {'timestamp': timestamp, 'stacks': stacks, 'removed': removed}
+
+    def stats_since(self, since):
+        with self._changed:
+            return {
+                'timestamp': self.timestamp,
+                'stats': self._stats if self._stats_updated > since else None,
+            }
+
+    def wait_for_change(self, since, timeout):
+        with self._changed:
+            self._changed.wait_for(lambda: self.timestamp > since, timeout)
+            return self.timestamp
+
+
+class DashboardHandler(BaseHTTPRequestHandler):
+    state = None
+    keepalive = 15
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        try:
+            since = float(query.get('since', ['0'])[0])
+        except ValueError:
+            self.send_error(400, "Invalid 'since' timestamp")
+            return
+
+        if url.path == '/':
+            self.send_body(DASHBOARD_HTML.encode('utf-8'), 'text/html; charset=utf-8')
+        elif url.path == '/api/timeline':
+            self.send_json(self.state.timeline_since(since))
+        elif url.path == '/api/stacks':
+            self.send_json(self.state.stacks_since(since))
+        elif url.path == '/api/stats':
+            self.send_json(self.state.stats_since(since))
+        elif url.path == '/api/events':
+            self.stream_events(since)
+        else:
+            self.send_error(404)
+
+    def send_body(self, body, content_type):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, data):
+        self.send_body(json.dumps(data).encode('utf-8'), 'application/json')
+
+    def stream_events(self, since):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        try:
+            while True:
+                timestamp = self.state.wait_for_change(since, self.keepalive)
+                if timestamp > since:
+                    since = timestamp
+                    self.wfile.write(f"data: {json.dumps({'timestamp': timestamp})}\n\n".encode('utf-8'))
+                else:
+                    self.wfile.write(b": keepalive\n\n")
+                self.wfile.flush()
+        except ConnectionError:
+            # The browser closed the page; Windows reports this as ConnectionAbortedError
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+def watch(state, interval, stop_event):
+    while not stop_event.wait(interval):
+        try:
+            state.refresh()
+        except Exception as e:
+            print(f"Error refreshing dashboard: {e}")
+
+
+def start_server(paths, port=DEFAULT_PORT, interval=DEFAULT_INTERVAL):
+    """Parse ``paths`` and serve the dashboard on localhost from background threads.
+
+    Returns the running server; call ``server.shutdown()`` to stop serving and watching
+    and to release the port.
+    """
+    state = DashboardState(paths)
+    state.refresh()
+
+    handler = type('BoundDashboardHandler', (DashboardHandler,), {'state': state})
+    server = ThreadingHTTPServer((HOST, port), handler)
+    server.daemon_threads = True
+    server.state = state
+
+    stop_event = threading.Event()
+    shutdown = server.shutdown
+
+    def stop():
+        stop_event.set()
+        shutdown()
+        server.server_close()
+
+    server.shutdown = stop
+    threading.Thread(target=watch, args=(state, interval, stop_event), daemon=True).start()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def dashboard_url(server):
+    return f"http://{HOST}:{server.server_address[1]}/"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a live poker session dashboard on localhost.")
+    parser.add_argument('paths', nargs='+', help="Hand history files or folders to watch")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL,
+                        help="Seconds between checks for new hands")
+    parser.add_argument('--no-browser', action='store_true')
+    args = parser.parse_args()
+
+    server = start_server(args.paths, args.port, args.interval)
+    url = dashboard_url(server)
+    print(f"Serving dashboard on {url}")
+    if not args.no_browser:
+        webbrowser.open(url)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+DASHBOARD_HTML = '''<html>
+<head>
+    <title>Poker Tournaments</title>
+    <script charset="utf-8" src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+        }
+        .stats p {
+            margin: 5px 0;
+        }
+    </style>
+</head>
+<body>
+    <div class="stats" id="stats"></div>
+    <div id="timeline" style="height:80vh;"></div>
+    <select id="tournament"></select>
+    <div id="stacks" style="height:60vh;"></div>
+    <script type="text/javascript">
+        const colors = {
+            'GG': '#ff0000',
+            'ACR': '#0000ff',
+            'Winamax': '#008000',
+            'PokerStars': '#800080',
+            '888': '#ffa500'
+        };
+        const entries = new Map();
+        const stacks = new Map();
+        let timelineSince = 0;
+        let stacksSince = 0;
+        let statsSince = 0;
+        let updating = null;
+
+        function renderTimeline() {
+            const sites = {};
+            for (const entry of entries.values()) {
+                const trace = sites[entry.Site] || (sites[entry.Site] = {base: [], x: [], y: [], text: []});
+                trace.base.push(entry.Start);
+                trace.x.push(new Date(entry.Finish) - new Date(entry.Start));
+                trace.y.push(entry.Tournament);
+                trace.text.push(entry.Starting_BB === null
+                    ? 'Starting BB=N/A' : `Starting BB=${entry.Starting_BB.toFixed(1)}`);
+            }
+            const traces = Object.entries(sites).map(([site, trace]) => ({
+                type: 'bar',
+                orientation: 'h',
+                name: site,
+                base: trace.base,
+                x: trace.x,
+                y: trace.y,
+                text: trace.text,
+                textposition: 'none',
+                marker: {color: colors[site]},
+                hovertemplate: '%{text}<extra></extra>'
+            }));
+            Plotly.react('timeline', traces, {
+                title: 'Poker Tournaments',
+                barmode: 'overlay',
+                xaxis: {type: 'date', title: 'Time'},
+                yaxis: {autorange: 'reversed', title: 'Tournaments'},
+                legend: {title: {text: 'Site'}},
+                margin: {l: 20, r: 20, t: 50, b: 20}
+            });
+        }
+
+        function renderStacks() {
+            // One tournament at a time, picked from the selector above the chart
+            const select = document.getElementById('tournament');
+            const tournaments = new Map();
+            [...stacks.values()]
+                .sort((a, b) => a.Times[0] < b.Times[0] ? -1 : 1)
+                .forEach(stack => {
+                    if (!tournaments.has(stack.Key)) {
+                        tournaments.set(stack.Key, {label: `${stack.Tournament} ${stack.Times[0].slice(11, 16)}`, stacks: []});
+                    }
+                    tournaments.get(stack.Key).stacks.push(stack);
+                });
+            const selected = tournaments.has(select.value) ? select.value : tournaments.keys().next().value;
+            select.replaceChildren(...[...tournaments].map(([key, tournament]) => new Option(tournament.label, key)));
+            select.value = selected || '';
+            const current = tournaments.get(selected);
+            const traces = (current ? current.stacks : []).map((stack, bullet) => ({
+                type: 'scatter',
+                mode: 'lines',
+                name: `Bullet ${bullet + 1}`,
+                x: stack.Times,
+                y: stack.Stack_BB,
+                hovertemplate: '%{y:.1f} BB<extra>%{fullData.name}</extra>'
+            }));
+            Plotly.react('stacks', traces, {
+                title: current ? `Stack Trajectory: ${current.label}` : 'Stack Trajectory',
+                xaxis: {type: 'date', title: 'Time'},
+                yaxis: {title: 'Stack (BB)'},
+                legend: {title: {text: 'Entry'}},
+                margin: {l: 20, r: 20, t: 50, b: 20}
+            });
+        }
+
+        function renderStats(stats) {
+            const container = document.getElementById('stats');
+            container.replaceChildren();
+            for (const [name, value] of Object.entries(stats)) {
+                const line = document.createElement('p');
+                const label = document.createElement('b');
+                label.textContent = `${name}: `;
+                line.append(label, String(value));
+                container.append(line);
+            }
+        }
+
+        async function fetchUpdates() {
+            const timeline = await (await fetch(`/api/timeline?since=${timelineSince}`)).json();
+            timeline.entries.forEach(entry => entries.set(entry.Id, entry));
+            timeline.removed.forEach(id => entries.delete(id));
+            timelineSince = timeline.timestamp;
+            if (timeline.entries.length || timeline.removed.length) {
+                renderTimeline();
+            }
+            const trajectories = await (await fetch(`/api/stacks?since=${stacksSince}`)).json();
+            trajectories.stacks.forEach(stack => stack.Times.length
+                ? stacks.set(stack.Id, stack) : stacks.delete(stack.Id));
+            trajectories.removed.forEach(id => stacks.delete(id));
+            stacksSince = trajectories.timestamp;
+            if (trajectories.stacks.length || trajectories.removed.length) {
+                renderStacks();
+            }
+            const stats = await (await fetch(`/api/stats?since=${statsSince}`)).json();
+            statsSince = stats.timestamp;
+            if (stats.stats) {
+                renderStats(stats.stats);
+            }
+        }
+
+        function update() {
+            updating = (updating || Promise.resolve()).then(fetchUpdates).catch(console.error);
+        }
+
+        document.getElementById('tournament').onchange = renderStacks;
+        update();
+        if (window.EventSource) {
+            new EventSource('/api/events').onmessage = update;
+        } else {
+            setInterval(update, 5000);
+        }
+    </script>
+</body>
+</html>
+'''
+
+
+if __name__ == '__main__':
+    main()
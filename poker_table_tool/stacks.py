@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+DEFAULT_MAX_POINTS = 300
+
+
+def lttb(xs, ys, threshold):
+    """Largest-Triangle-Three-Buckets downsampling; returns the indices of the points to keep.
+
+    The first and last points are always kept, and from every bucket in between
+    the point forming the largest triangle with its neighbours is picked, so
+    peaks and busts survive even when most points are dropped.
+    """
+    n = len(xs)
+    if threshold >= n:
+        return list(range(n))
+    if threshold < 3:
+        return [0, n - 1][:max(threshold, 1)]
+
+    every = (n - 2) / (threshold - 2)
+    indices = [0]
+    a = 0
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = sum(xs[avg_start:avg_end]) / (avg_end - avg_start)
+        avg_y = sum(ys[avg_start:avg_end]) / (avg_end - avg_start)
+
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        ax, ay = xs[a], ys[a]
+        max_area, next_a = -1.0, range_start
+        for j in range(range_start, range_end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > max_area:
+                max_area, next_a = area, j
+        indices.append(next_a)
+        a = next_a
+    indices.append(n - 1)
+    return indices
+
+
+def downsample_trajectory(entry, max_points=DEFAULT_MAX_POINTS):
+    """Return the (times, stacks in BB) of an entry's stack trajectory, reduced to max_points."""
+    offsets, stacks = entry['Hand_Offsets'], entry['Stack_BB']
+    indices = lttb(offsets, stacks, max_points)
+    times = [entry['Start'] + timedelta(seconds=offsets[i]) for i in indices]
+    return times, [round(stacks[i], 1) for i in indices]
@@ -0,0 +1,76 @@
+from collections import defaultdict
+from datetime import timedelta
+
+
+# Function to calculate and return statistics
+def calculate_statistics(tournament_data):
+    total_bullets, re_entries, unique_tournaments = 0, 0, len(tournament_data)
+    total_duration, peak_duration, peak_start_time = timedelta(), timedelta(), None
+    timeline = []
+
+    # Creating a timeline with start and end times to calculate average and peak tables played
+    for tournament_name, entries in tournament_data.items():
+        total_bullets += len(entries)
+        re_entries += len(entries) - 1 if len(entries) > 1 else 0
+        for entry in entries:
+            duration = entry['last_hand_time'] - entry['first_hand_time']
+            total_duration += duration
+            timeline.append((entry['first_hand_time'], 1))  # Add event for starting a table
+            timeline.append((entry['last_hand_time'], -1))  # Add event for closing a table
+
+    # Sort the timeline based on time
+    timeline.sort()
+
+    # Calculating max tables played at a time and average tables played
+    max_tables, current_tables = 0, 0
+    total_tables_time, last_time = timedelta(), None
+    peak_tables, peak_duration = 0, timedelta()
+
+    for time, change in timeline:
+        if last_time is not None:
+            elapsed_time = time - last_time
+            total_tables_time += elapsed_time * current_tables
+
+            # Checking if we are in the peak overlap time
+            if current_tables == max_tables:
+                peak_duration += elapsed_time
+
+        current_tables += change
+        if current_tables > max_tables:
+            max_tables = current_tables
+            peak_duration = timedelta()  # Reset peak time duration when new max is reached
+
+        last_time = time
+
+    # Calculating average tables played across the full session
+    full_session_duration = timeline[-1][0] - timeline[0][0] if timeline else timedelta()
+    avg_tables_played = total_tables_time.total_seconds() / full_session_duration.total_seconds() if full_session_duration else 0
+
+    return {
+        "Session duration": str(full_session_duration).split('.')[0],
+        "Unique tournaments played": unique_tournaments,
+        "Re-Entries": re_entries,
+        "Total bullets": total_bullets,
+        "Average duration per tournament": total_duration / total_bullets if total_bullets else timedelta(),
+        "Maximum tables played at a time": max_tables,
+        "Average tables played": avg_tables_played,
+        "Peak tables played for (total time)": peak_duration
+    }
+
+
+def group_entries_by_tournament(entries):
+    """Reshape timeline entries into the tournament_data layout used by calculate_statistics.
+
+    Entries are grouped per (site, tournament id, player), since sites reuse
+    the same tournament name for every scheduled run; the name is kept on each
+    entry for display only.
+    """
+    tournament_data = defaultdict(list)
+    for entry in sorted(entries, key=lambda e: e['Start']):
+        tournament_data[(entry['Site'], entry['Tournament_Id'], entry['Player'])].append({
+            'tournament_name': entry['Tournament'],
+            'first_hand_time': entry['Start'],
+            'last_hand_time': entry['Finish'],
+            'stack_in_bb': int(entry['Starting_BB']) if entry['Starting_BB'] is not None else None,
+        })
+    return tournament_data
@@ -0,0 +1,60 @@
+from array import array
+from collections import defaultdict
+
+
+def build_tournament_entries(hands):
+    """Group hands into tournament entries, splitting re-entries on gaps over 30 minutes.
+
+    Each entry carries the hero's stack trajectory as two float32 arrays:
+    ``Hand_Offsets`` (seconds since the entry's first hand) and ``Stack_BB``,
+    holding only the hands whose stack could be read.
+    """
+    tournament_entries = defaultdict(lambda: {'hands': [], 'starting_bb': None, 'tournament_label': None})
+    for hand in hands:
+        if hand['date']:
+            key = (hand['site'], hand['tournament_id'], hand['player'])
+            tournament_entries[key]['hands'].append((hand['date'], hand.get('stack_bb')))
+            if tournament_entries[key]['starting_bb'] is None:
+                tournament_entries[key]['starting_bb'] = hand['starting_bb']
+            if tournament_entries[key]['tournament_label'] is None:
+                tournament_entries[key]['tournament_label'] = hand['tournament_label']
+            tournament_entries[key]['tournament_name'] = hand['tournament_name']
+
+    entries = []
+    for key, value in tournament_entries.items():
+        site, tournament_id, player = key
+        tournament_hands = sorted(value['hands'], key=lambda hand: hand[0])
+        starting_bb = value['starting_bb']
+        if not tournament_hands:
+            continue
+        tournament_label = value['tournament_label']
+        tournament_display = f"{tournament_label} ({site})"
+        entries_in_tournament = []
+        current_entry = [tournament_hands[0]]
+        for previous, hand in zip(tournament_hands, tournament_hands[1:]):
+            if (hand[0] - previous[0]).total_seconds() > 1800:
+                entries_in_tournament.append(current_entry)
+                current_entry = [hand]
+            else:
+                current_entry.append(hand)
+        entries_in_tournament.append(current_entry)
+        for idx, entry_hands in enumerate(entries_in_tournament):
+            start_time, end_time = entry_hands[0][0], entry_hands[-1][0]
+            readable_stacks = [stack_bb for _, stack_bb in entry_hands if stack_bb is not None]
+            entries.append({
+                'Id': f"{site}|{tournament_id}|{player}|{idx}",
+                'Tournament': tournament_display,
+                'Tournament_Id': tournament_id,
+                'Start': start_time,
+                'Finish': end_time,
+                'Site': site,
+                'Player': player,
+                # Each bullet starts from its own first readable stack, kept at full precision
+                'Starting_BB': readable_stacks[0] if readable_stacks else starting_bb,
+                'Hand_Offsets': array('f', [
+                    (date - start_time).total_seconds() for date, stack_bb in entry_hands if stack_bb is not None
+                ]),
+                'Stack_BB': array('f', readable_stacks),
+            })
+
+    return entries
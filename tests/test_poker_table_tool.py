@@ -1,5 +1,292 @@
-from poker_table_tool import __version__
+import json
+from datetime import datetime
+import os
+import threading
+import urllib.request
+
+import pytest
+
+from poker_table_tool import __version__, hand_history, heroes
+from poker_table_tool.batch import ingest, load_stable
+from poker_table_tool.hand_history import detect_player, parse_file, parse_hand_history
+from poker_table_tool.heroes import HeroCache
+from poker_table_tool.pipeline import Pipeline
+from poker_table_tool.stacks import downsample_trajectory, lttb
+from poker_table_tool.timeline import build_tournament_entries
+from poker_table_tool.server import DashboardState, dashboard_url, start_server
+
+
+@pytest.fixture(autouse=True)
+def hero_cache_file(tmp_path):
+    path = tmp_path / 'heroes.json'
+    heroes.set_default_hero_cache(HeroCache(str(path)))
+    yield path
+    heroes.set_default_hero_cache(None)
+
+
+def gg_hand(hand_id, time, hero_stack=20000, big_blind=200, hero='Hero', tournament_id=1001):
+    return (
+        f"Poker Hand #TM{hand_id}: Tournament #{tournament_id}, Bounty Hunters $10 Hold'em No Limit"
+        f" - Level1({big_blind // 2:,}/{big_blind:,}) - 2024/10/01 {time}\n"
+        "Table '1' 8-max Seat #1 is the button\n"
+        f"Seat 1: {hero} ({hero_stack:,} in chips)\n"
+        "Seat 2: Villain (20,000 in chips)\n"
+        "*** HOLE CARDS ***\n"
+        f"Dealt to {hero} [Ah Kd]\n"
+        "Dealt to Villain \n"
+        "\n\n"
+    )
+
+
+def write_gg_file(path, times, stacks=None, **kwargs):
+    # GG exports list the most recent hand first
+    stacks = stacks or [20000] * len(times)
+    hands = [gg_hand(i, time, stack, **kwargs) for i, (time, stack) in enumerate(zip(times, stacks))]
+    path.write_text(''.join(reversed(hands)), encoding='utf-8')
 
 
 def test_version():
     assert __version__ == '0.1.0'
+
+
+def test_parse_file_reads_stack_in_bb_for_every_hand(tmp_path):
+    hh = tmp_path / 'GG20241001 - Bounty Hunters.txt'
+    write_gg_file(hh, ['12:00:00', '12:01:00', '12:02:00'], stacks=[20000, 30000, 5000])
+
+    hands = parse_file(str(hh))
+    assert [hand['stack_bb'] for hand in hands] == [100.0, 150.0, 25.0]
+    assert {hand['starting_bb'] for hand in hands} == {100.0}
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    xs = list(range(1000))
+    ys = [100.0] * 1000
+    ys[400] = 500.0
+    ys[700] = 0.0
+
+    indices = lttb(xs, ys, 20)
+    assert len(indices) == 20
+    assert indices[0] == 0 and indices[-1] == 999
+    assert 400 in indices and 700 in indices
+    assert lttb(xs[:10], ys[:10], 20) == list(range(10))
+
+
+def test_stack_trajectory_is_float32_and_downsampled(tmp_path):
+    hh = tmp_path / 'GG20241001 - Bounty Hunters.txt'
+    times = [f"12:{minute:02d}:{second:02d}" for minute in range(10) for second in range(0, 60, 10)]
+    write_gg_file(hh, times, stacks=[20000 + 100 * i for i in range(len(times))])
+
+    [entry] = build_tournament_entries(parse_file(str(hh)))
+    assert entry['Stack_BB'].typecode == 'f'
+    assert len(entry['Stack_BB']) == len(times)
+
+    stack_times, stacks = downsample_trajectory(entry, max_points=10)
+    assert len(stacks) == 10
+    assert stacks[0] == 100.0 and stacks[-1] == 129.5
+    assert stack_times[-1] == entry['Finish']
+
+
+def test_dashboard_state_returns_deltas_since_timestamp(tmp_path):
+    hh = tmp_path / 'GG20241001 - Bounty Hunters.txt'
+    write_gg_file(hh, ['12:00:00', '12:01:00'])
+
+    state = DashboardState([str(tmp_path)])
+    assert state.refresh()
+    first = state.timeline_since(0)
+    assert [entry['Tournament'] for entry in first['entries']] == ['Bounty Hunters (GG)']
+    assert state.stats_since(0)['stats']['Total bullets'] == 1
+
+    assert not state.refresh()
+    assert state.timeline_since(first['timestamp'])['entries'] == []
+    assert state.stats_since(first['timestamp'])['stats'] is None
+
+    write_gg_file(hh, ['12:00:00', '12:01:00', '13:00:00'])
+    os.utime(hh, (0, 0))
+    assert state.refresh()
+    delta = state.timeline_since(first['timestamp'])
+    assert [entry['Id'] for entry in delta['entries']] == ['GG|1001|Hero|1']
+    assert delta['removed'] == []
+    assert state.stats_since(first['timestamp'])['stats']['Re-Entries'] == 1
+
+
+def test_dashboard_server_serves_json_on_localhost(tmp_path):
+    write_gg_file(tmp_path / 'GG20241001 - Bounty Hunters.txt', ['12:00:00', '12:01:00'])
+
+    server = start_server([str(tmp_path)], port=0, interval=60)
+    try:
+        url = dashboard_url(server)
+        assert url.startswith('http://127.0.0.1:')
+        with urllib.request.urlopen(url + 'api/timeline?since=0') as response:
+            timeline = json.load(response)
+        assert timeline['entries'][0]['Start'] == '2024-10-01T12:00:00'
+        with urllib.request.urlopen(url + f"api/timeline?since={timeline['timestamp']}") as response:
+            assert json.load(response)['entries'] == []
+    finally:
+        server.shutdown()
+
+    # The port is released, so a new dashboard can take it over
+    with pytest.raises(OSError):
+        urllib.request.urlopen(url, timeout=2)
+    start_server([str(tmp_path)], port=server.server_address[1], interval=60).shutdown()
+
+
+def test_batch_ingest_uses_account_aliases_per_player(tmp_path, hero_cache_file):
+    for player, account, tournament_id in [('alice', 'alice88', 2001), ('bob', 'b0b', 2002)]:
+        (tmp_path / player).mkdir()
+        write_gg_file(
+            tmp_path / player / 'GG20241001 - Bounty Hunters.txt', ['12:00:00', '12:01:00'],
+            hero=account, tournament_id=tournament_id,
+        )
+    config = tmp_path / 'stable.json'
+    config.write_text(json.dumps({
+        'alice': {'accounts': ['alice88'], 'directories': ['alice']},
+        'bob': {'accounts': ['b0b', 'bob_old'], 'directories': ['bob']},
+    }), encoding='utf-8')
+
+    hands_by_player = ingest(load_stable(str(config)), workers=2)
+    assert {hand['player'] for hand in hands_by_player['alice']} == {'alice88'}
+    assert {hand['tournament_id'] for hand in hands_by_player['bob']} == {'2002'}
+    assert len(hands_by_player['bob']) == 2
+    # Stable accounts stay out of the persisted single-player hero cache
+    assert not hero_cache_file.exists()
+
+
+def test_detect_player_uses_dealt_to_lines_over_seat_counts():
+    content = (
+        "Seat 1: Regular (20,000 in chips)\n"
+        "Seat 2: Hero (20,000 in chips)\n"
+        "Dealt to Regular \n"
+        "Dealt to Hero [Ah Kd]\n"
+        "Seat 1: Regular folded\n"
+        "Seat 2: Hero won (400)\n"
+    )
+    cache = HeroCache()
+    assert detect_player(content, 'GG', hero_cache=cache) == 'Hero'
+    assert cache.get('GG') == ['Hero']
+    assert detect_player(content, 'GG', hero_aliases=['Regular']) is None
+
+
+def test_hero_cache_persists_across_runs(hero_cache_file):
+    write_gg_file(hero_cache_file.parent / 'GG20241001 - Bounty Hunters.txt', ['12:00:00'], hero='n1ts')
+    parse_file(str(hero_cache_file.parent / 'GG20241001 - Bounty Hunters.txt'))
+
+    cache = HeroCache(str(hero_cache_file))
+    assert cache.get('GG') == ['n1ts']
+    # Without hole cards the cached hero is still recognised among the seated players
+    content = "Seat 1: Regular (20,000 in chips)\nSeat 2: n1ts (20,000 in chips)\nSeat 1: Regular folded\n"
+    assert detect_player(content, 'GG', hero_cache=cache) == 'n1ts'
+
+
+def test_pipeline_feeds_stats_and_export_from_one_pass(tmp_path, monkeypatch):
+    write_gg_file(tmp_path / 'GG20241001.txt', ['12:00:00', '12:01:00', '13:00:00'])
+    pipeline = Pipeline([str(tmp_path)])
+
+    assert [entry['Tournament'] for entry in pipeline.entries] == ['Bounty Hunters $10 (GG)'] * 2
+    assert pipeline.stats['Re-Entries'] == 1
+
+    # Later stages reuse the hands already in memory instead of reading the files again
+    monkeypatch.setattr('poker_table_tool.pipeline.load_hand_histories', None)
+    export = pipeline.export_csv(str(tmp_path / 'entries.csv'))
+    with open(export, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    assert lines[0] == 'Tournament,Site,Player,Start,Finish,Starting_BB'
+    assert lines[1] == 'Bounty Hunters $10 (GG),GG,Hero,2024-10-01 12:00:00,2024-10-01 12:01:00,100.0'
+
+
+def test_same_named_tournaments_are_not_merged(tmp_path):
+    write_gg_file(tmp_path / 'GG20241001-1.txt', ['12:00:00', '12:30:00'], tournament_id=1)
+    write_gg_file(tmp_path / 'GG20241001-2.txt', ['13:00:00', '13:30:00'], tournament_id=2)
+    pipeline = Pipeline([str(tmp_path)])
+
+    assert {entry['Tournament'] for entry in pipeline.entries} == {'Bounty Hunters $10 (GG)'}
+    assert pipeline.stats['Unique tournaments played'] == 2
+    assert pipeline.stats['Re-Entries'] == 0
+
+
+def test_hand_times_from_different_sites_share_one_clock(monkeypatch):
+    monkeypatch.setattr(hand_history, 'LOCAL_TIMEZONE', 'Europe/Berlin')
+    pokerstars = (
+        "PokerStars Hand #1: Tournament #11, $10+$1 USD Hold'em No Limit - Level I (10/20)"
+        " - 2024/10/01 14:00:00 CET [2024/10/01 8:00:00 ET]\n"
+        "Seat 1: Hero (1500 in chips)\n"
+        "Dealt to Hero [Ah Kd]\n"
+    )
+    winamax = (
+        "Winamax Poker - Tournament \"Freeroll\" buy-in: 0\u20ac level: 1 - HandId: #22-1-1"
+        " - Holdem no limit (10/20) - 2024/10/01 12:00:00 UTC\n"
+        "Seat 1: Hero (20000)\n"
+        "Dealt to Hero [Ah Kd]\n"
+    )
+    cache = HeroCache()
+    times = {
+        site: parse_hand_history(content, site, hero_cache=cache)[0][0]['date']
+        for site, content in [('PokerStars', pokerstars), ('Winamax', winamax)]
+    }
+    assert times['PokerStars'] == times['Winamax'] == datetime(2024, 10, 1, 14, 0)
+
+
+def test_hero_cache_is_safe_to_share_between_threads(hero_cache_file):
+    cache = HeroCache(str(hero_cache_file))
+    threads = [
+        threading.Thread(target=lambda i=i: [cache.add(f"site{j % 5}", f"hero{i}-{j}") for j in range(50)])
+        for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    saved = json.loads(hero_cache_file.read_text(encoding='utf-8'))
+    assert sum(len(names) for names in saved.values()) == 200
+
+
+def test_each_reentry_reports_its_own_starting_stack(tmp_path):
+    write_gg_file(
+        tmp_path / 'GG20241001 - Bounty Hunters.txt', ['12:00:00', '12:01:00', '13:00:00'],
+        stacks=[20000, 400, 30000],
+    )
+    pipeline = Pipeline([str(tmp_path)])
+
+    assert [entry['Starting_BB'] for entry in pipeline.entries] == [100.0, 150.0]
+    [entries] = pipeline.tournament_data.values()
+    assert [entry['stack_in_bb'] for entry in entries] == [100, 150]
+
+
+def test_parse_errors_skip_only_the_broken_file(tmp_path, monkeypatch):
+    write_gg_file(tmp_path / 'GG20241001 - Bounty Hunters.txt', ['12:00:00'])
+    write_gg_file(tmp_path / 'GG20241001 - Broken.txt', ['12:00:00'])
+    parse_hand_history = hand_history.parse_hand_history
+
+    def parse_or_fail(content, site, tournament_label=None, *args):
+        if tournament_label == 'Broken':
+            raise ValueError("unexpected hand history layout")
+        return parse_hand_history(content, site, tournament_label, *args)
+
+    monkeypatch.setattr(hand_history, 'parse_hand_history', parse_or_fail)
+    assert parse_file(str(tmp_path / 'GG20241001 - Broken.txt')) == []
+
+    state = DashboardState([str(tmp_path)])
+    assert state.refresh()
+    assert [entry['Tournament'] for entry in state.timeline_since(0)['entries']] == ['Bounty Hunters (GG)']
+
+
+def test_cached_hero_is_accepted_without_rewriting_the_cache(hero_cache_file, monkeypatch):
+    write_gg_file(hero_cache_file.parent / 'GG20241001 - Bounty Hunters.txt', ['12:00:00', '12:01:00'])
+    cache = HeroCache(str(hero_cache_file))
+    cache.add('GG', 'Hero')
+    cache.add('GG', 'alt_account')
+
+    saves = []
+    monkeypatch.setattr(cache, '_save', saves.append)
+    hands = parse_file(str(hero_cache_file.parent / 'GG20241001 - Bounty Hunters.txt'), hero_cache=cache)
+    assert {hand['player'] for hand in hands} == {'Hero'}
+    assert saves == []
+
+
+def test_starting_stack_keeps_full_precision(tmp_path):
+    hh = tmp_path / 'GG20241001 - Bounty Hunters.txt'
+    write_gg_file(hh, ['12:00:00'], stacks=[2000], big_blind=300)
+
+    [entry] = Pipeline([str(tmp_path)]).entries
+    assert entry['Starting_BB'] == 2000 / 300
+    assert entry['Stack_BB'].typecode == 'f'